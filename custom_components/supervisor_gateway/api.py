@@ -1,61 +1,265 @@
 """API views for Supervisor Gateway."""
+import asyncio
+import functools
+import hmac
 import logging
+import os
+import re
 import time
-from collections import defaultdict
+from collections import OrderedDict
+from collections.abc import Callable
 import aiohttp
 from aiohttp import web
 
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "supervisor_gateway"
 SUPERVISOR_URL = "http://supervisor"
+SUPERVISOR_MAX_CONCURRENT = 16  # quick Supervisor requests in flight, others wait their turn
+SUPERVISOR_MAX_CONCURRENT_ACTIONS = 32  # actions and updates in flight, kept apart from quick requests
+# Room for both kinds at once, so long updates never hold the connections quick requests need
+SUPERVISOR_MAX_CONNECTIONS = SUPERVISOR_MAX_CONCURRENT + SUPERVISOR_MAX_CONCURRENT_ACTIONS
+SUPERVISOR_KEEPALIVE = 75  # seconds an idle Supervisor connection stays open
+SUPERVISOR_DNS_CACHE = 300  # seconds the resolved Supervisor address is reused
+SUPERVISOR_TIMEOUT = 10  # seconds, default for Supervisor calls
+SUPERVISOR_SLOT_WAIT = 5  # seconds a call waits for a free slot before answering 503
+ACTION_TIMEOUT = aiohttp.ClientTimeout(total=30)
+UPDATE_TIMEOUT = aiohttp.ClientTimeout(total=300)
+
+# Supervisor addon slugs, e.g. "core_ssh" or "a0d7b954_vscode"
+ADDON_SLUG_RE = re.compile(r"[A-Za-z0-9][-_.A-Za-z0-9]{0,127}")
+INVALID_SLUG_MESSAGE = "Invalid addon slug"
+# The action route, membership check and error message are all built from this
+ADDON_ACTION_NAMES = ("update", "start", "stop", "restart")
+ADDON_ACTIONS = frozenset(ADDON_ACTION_NAMES)
+ADDON_ACTION_PATTERN = "|".join(ADDON_ACTION_NAMES)
+INVALID_ACTION_MESSAGE = f"Invalid action. Allowed: {', '.join(ADDON_ACTION_NAMES)}"
+BATCH_MAX_OPS = 32  # addon actions accepted in one /addons:batch request
+# Addon info requests in flight for one GET /addons?hydrate=1. Kept well below
+# SUPERVISOR_MAX_CONCURRENT so other requests still find a free slot.
+HYDRATE_CONCURRENCY = 4
 
 AUTH_RATE_LIMIT = 3  # max requests per token
 AUTH_RATE_WINDOW = 60  # seconds
-_auth_request_log: dict[str, list[float]] = defaultdict(list)
-
-
-def validate_api_key(hass: HomeAssistant, request) -> bool:
-    """Validate x-api-key header (required)."""
-    if DOMAIN not in hass.data:
-        _LOGGER.error("Supervisor Gateway not configured - api_key required in configuration.yaml")
+AUTH_RATE_MAX_TOKENS = 1024  # least recently used tokens are forgotten beyond this
+# Token bucket kept in integer nanoseconds: each request costs one interval,
+# and the bucket holds up to AUTH_RATE_LIMIT intervals of credit.
+_AUTH_INTERVAL_NS = AUTH_RATE_WINDOW * 1_000_000_000 // AUTH_RATE_LIMIT
+_AUTH_BURST_NS = (AUTH_RATE_LIMIT - 1) * _AUTH_INTERVAL_NS
+# token -> monotonic_ns time at which the bucket is full again
+_auth_buckets: OrderedDict[str, int] = OrderedDict()
+
+INVALID_KEY_LOG_INTERVAL = 60  # seconds before invalid x-api-keys from the same client are logged again
+INVALID_KEY_MAX_TRACKED = 256
+# client address -> monotonic time an invalid x-api-key from it was last logged
+_invalid_keys_logged: OrderedDict[str | None, float] = OrderedDict()
+
+PROXY_CACHE_TTL = 5  # seconds GET /addons and /addons/{slug} responses are reused
+# Supervisor path -> (expires at, content type, body)
+_proxy_cache: dict[str, tuple[float, str, bytes]] = {}
+# Supervisor path -> in-flight GET shared by concurrent callers
+_inflight_gets: dict[str, asyncio.Task[web.Response]] = {}
+# Bumped on every invalidation so a GET started before it is not cached
+_cache_generation = 0
+
+
+def consume_auth_rate_limit(token: str) -> bool:
+    """Take one request from the token's bucket, return False if it is empty."""
+    now = time.monotonic_ns()
+    full_at = max(_auth_buckets.get(token, now), now)
+
+    if full_at - now > _AUTH_BURST_NS:
         return False
 
-    configured_key = hass.data[DOMAIN].get("api_key")
-    if not configured_key:
-        _LOGGER.error("api_key not configured in configuration.yaml - this is required")
-        return False
+    _auth_buckets[token] = full_at + _AUTH_INTERVAL_NS
+    _auth_buckets.move_to_end(token)
+    if len(_auth_buckets) > AUTH_RATE_MAX_TOKENS:
+        _auth_buckets.popitem(last=False)
+    return True
 
-    # Check x-api-key header
-    provided_key = request.headers.get("x-api-key")
-    if not provided_key:
-        _LOGGER.warning(f"Missing x-api-key header from {request.remote}")
-        return False
 
-    if provided_key != configured_key:
-        _LOGGER.warning(f"Invalid x-api-key from {request.remote}")
+def should_log_invalid_key(remote: str | None) -> bool:
+    """Return True if no invalid key from remote was logged in the last INVALID_KEY_LOG_INTERVAL."""
+    now = time.monotonic()
+    last_logged = _invalid_keys_logged.get(remote)
+    if last_logged is not None and now - last_logged < INVALID_KEY_LOG_INTERVAL:
         return False
 
+    _invalid_keys_logged[remote] = now
+    _invalid_keys_logged.move_to_end(remote)
+    if len(_invalid_keys_logged) > INVALID_KEY_MAX_TRACKED:
+        _invalid_keys_logged.popitem(last=False)
     return True
 
 
+def build_api_key_validator(api_key: str | None) -> Callable[[web.Request], bool]:
+    """Return an x-api-key validator bound to the configured api_key."""
+    if not api_key:
+        def validate_api_key(request: web.Request) -> bool:
+            """Reject every request, no api_key is configured."""
+            _LOGGER.error("api_key not configured in configuration.yaml - this is required")
+            return False
+
+        return validate_api_key
+
+    configured_key = api_key.encode()
+
+    def validate_api_key(request: web.Request) -> bool:
+        """Validate x-api-key header (required)."""
+        provided_key = request.headers.get("x-api-key")
+        if not provided_key:
+            _LOGGER.warning("Missing x-api-key header from %s", request.remote)
+            return False
+
+        # aiohttp decodes headers with surrogateescape, this restores the raw bytes
+        if not hmac.compare_digest(provided_key.encode("utf-8", "surrogateescape"), configured_key):
+            if should_log_invalid_key(request.remote):
+                _LOGGER.warning("Invalid x-api-key from %s", request.remote)
+            return False
+
+        return True
+
+    return validate_api_key
+
+
+def require_api_key(handler):
+    """Reject the request with 401 unless the view's x-api-key validator accepts it."""
+
+    @functools.wraps(handler)
+    async def wrapper(view, request, *args, **kwargs):
+        if not view.validate_api_key(request):
+            return view.json_message("Invalid or missing x-api-key header", 401)
+        return await handler(view, request, *args, **kwargs)
+
+    return wrapper
+
+
+def get_cached_response(path: str) -> web.Response | None:
+    """Return the cached Supervisor response for path if it is still fresh."""
+    entry = _proxy_cache.get(path)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return web.Response(body=entry[2], content_type=entry[1])
+
+
+def cache_response(path: str, content_type: str, body: bytes) -> None:
+    """Cache a successful Supervisor response for PROXY_CACHE_TTL seconds."""
+    _proxy_cache[path] = (time.monotonic() + PROXY_CACHE_TTL, content_type, body)
+
+
+def invalidate_addon_cache(addon_slug: str) -> None:
+    """Drop cached and in-flight responses that an action on addon_slug may have changed."""
+    global _cache_generation
+    _cache_generation += 1
+    for path in ("/addons", f"/addons/{addon_slug}/info"):
+        _proxy_cache.pop(path, None)
+        # Later callers start a fresh GET instead of joining one from before the action
+        _inflight_gets.pop(path, None)
+
+
+def forget_inflight_get(path: str, task: asyncio.Task[web.Response]) -> None:
+    """Remove a finished GET from the in-flight table unless it was already replaced."""
+    if _inflight_gets.get(path) is task:
+        del _inflight_gets[path]
+
+
+def resolve_supervisor_headers(hass: HomeAssistant) -> dict[str, str] | None:
+    """Build the Supervisor Authorization header from the environment or hassio data."""
+    supervisor_token = os.environ.get("SUPERVISOR_TOKEN")
+
+    if not supervisor_token and "hassio" in hass.data:
+        supervisor_token = hass.data["hassio"].get("supervisor_token")
+
+    if not supervisor_token:
+        return None
+
+    return {"Authorization": f"Bearer {supervisor_token}"}
+
+
 async def async_setup(hass: HomeAssistant):
     """Set up API views."""
+    hass.data[DOMAIN]["validate_api_key"] = build_api_key_validator(hass.data[DOMAIN].get("api_key"))
+    hass.data[DOMAIN]["auth_headers"] = resolve_supervisor_headers(hass)
+
+    # One pooled session for all Supervisor calls so connections are kept alive
+    session = aiohttp.ClientSession(
+        base_url=SUPERVISOR_URL,
+        timeout=aiohttp.ClientTimeout(total=SUPERVISOR_TIMEOUT),
+        connector=aiohttp.TCPConnector(
+            limit=SUPERVISOR_MAX_CONNECTIONS,
+            keepalive_timeout=SUPERVISOR_KEEPALIVE,
+            ttl_dns_cache=SUPERVISOR_DNS_CACHE,
+        ),
+    )
+    hass.data[DOMAIN]["session"] = session
+    hass.data[DOMAIN]["request_semaphore"] = asyncio.Semaphore(SUPERVISOR_MAX_CONCURRENT)
+    hass.data[DOMAIN]["action_semaphore"] = asyncio.Semaphore(SUPERVISOR_MAX_CONCURRENT_ACTIONS)
+
+    async def _async_close_session(event):
+        await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_session)
+
     hass.http.register_view(SupervisorGatewayView())
     hass.http.register_view(SupervisorGatewayHealthView())
     hass.http.register_view(SupervisorGatewayAuthView(hass))
     hass.http.register_view(SupervisorGatewayAddonsView(hass))
     hass.http.register_view(SupervisorGatewayAddonView(hass))
     hass.http.register_view(SupervisorGatewayAddonActionView(hass))
+    hass.http.register_view(SupervisorGatewayAddonsBatchView(hass))
     hass.http.register_view(SupervisorGatewayOsInfoView(hass))
     hass.http.register_view(SupervisorGatewayOsUpdateView(hass))
     hass.http.register_view(SupervisorGatewayCoreInfoView(hass))
     hass.http.register_view(SupervisorGatewayCoreUpdateView(hass))
 
 
+# Static payloads are serialized once instead of on every request
+ROOT_BODY = json_bytes({
+    "message": "Supervisor Gateway API",
+    "version": "0.0.2",
+    "available_endpoints": {
+        "utility": [
+            "GET /api/supervisor_gateway/health",
+            "GET /api/supervisor_gateway/auth",
+        ],
+        "addon_management": [
+            "GET /api/supervisor_gateway/addons",
+            "GET /api/supervisor_gateway/addons?hydrate=1",
+            "GET /api/supervisor_gateway/addons/{slug}",
+            "POST /api/supervisor_gateway/addons/{slug}/update",
+            "POST /api/supervisor_gateway/addons/{slug}/start",
+            "POST /api/supervisor_gateway/addons/{slug}/stop",
+            "POST /api/supervisor_gateway/addons/{slug}/restart",
+            "POST /api/supervisor_gateway/addons:batch"
+        ],
+        "os": [
+            "GET /api/supervisor_gateway/os/info",
+            "POST /api/supervisor_gateway/os/update"
+        ],
+        "core": [
+            "GET /api/supervisor_gateway/core/info",
+            "POST /api/supervisor_gateway/core/update"
+        ]
+    },
+    "authentication": {
+        "ha_token": "Required - Use 'Authorization: Bearer YOUR_HA_TOKEN' header",
+        "x_api_key": "Required - Use 'x-api-key: YOUR_API_KEY' header - Must be configured in configuration.yaml"
+    }
+})
+
+HEALTH_BODY = json_bytes({
+    "status": "healthy",
+    "service": "supervisor-gateway",
+    "version": "0.0.2"
+})
+
+
 class SupervisorGatewayView(HomeAssistantView):
     """Root API view."""
 
@@ -65,36 +269,7 @@ class SupervisorGatewayView(HomeAssistantView):
 
     async def get(self, request):
         """Handle GET request."""
-        return self.json({
-            "message": "Supervisor Gateway API",
-            "version": "0.0.2",
-            "available_endpoints": {
-                "utility": [
-                    "GET /api/supervisor_gateway/health",
-                    "GET /api/supervisor_gateway/auth",
-                ],
-                "addon_management": [
-                    "GET /api/supervisor_gateway/addons",
-                    "GET /api/supervisor_gateway/addons/{slug}",
-                    "POST /api/supervisor_gateway/addons/{slug}/update",
-                    "POST /api/supervisor_gateway/addons/{slug}/start",
-                    "POST /api/supervisor_gateway/addons/{slug}/stop",
-                    "POST /api/supervisor_gateway/addons/{slug}/restart"
-                ],
-                "os": [
-                    "GET /api/supervisor_gateway/os/info",
-                    "POST /api/supervisor_gateway/os/update"
-                ],
-                "core": [
-                    "GET /api/supervisor_gateway/core/info",
-                    "POST /api/supervisor_gateway/core/update"
-                ]
-            },
-            "authentication": {
-                "ha_token": "Required - Use 'Authorization: Bearer YOUR_HA_TOKEN' header",
-                "x_api_key": "Required - Use 'x-api-key: YOUR_API_KEY' header - Must be configured in configuration.yaml"
-            }
-        })
+        return web.Response(body=ROOT_BODY, content_type="application/json")
 
 
 class SupervisorGatewayHealthView(HomeAssistantView):
@@ -106,11 +281,7 @@ class SupervisorGatewayHealthView(HomeAssistantView):
 
     async def get(self, request):
         """Handle GET request."""
-        return self.json({
-            "status": "healthy",
-            "service": "supervisor-gateway",
-            "version": "0.0.2"
-        })
+        return web.Response(body=HEALTH_BODY, content_type="application/json")
 
 
 class SupervisorGatewayAuthView(HomeAssistantView):
@@ -123,306 +294,309 @@ class SupervisorGatewayAuthView(HomeAssistantView):
     def __init__(self, hass: HomeAssistant):
         """Initialize."""
         self.hass = hass
+        self.validate_api_key = hass.data[DOMAIN]["validate_api_key"]
 
     async def get(self, request):
         """Handle GET request - validate both HA token and x-api-key."""
         token = request.headers.get("Authorization", "")
-        now = time.monotonic()
 
-        _auth_request_log[token] = [t for t in _auth_request_log[token] if now - t < AUTH_RATE_WINDOW]
-
-        if len(_auth_request_log[token]) >= AUTH_RATE_LIMIT:
+        if not consume_auth_rate_limit(token):
             _LOGGER.warning("Rate limit exceeded on /auth")
             return self.json_message("Rate limit exceeded", 429)
 
-        _auth_request_log[token].append(now)
-
-        if not validate_api_key(self.hass, request):
+        if not self.validate_api_key(request):
             return web.Response(status=401, text="401: Unauthorized")
 
         return self.json({"authenticated": True})
 
 
-class SupervisorGatewayAddonsView(HomeAssistantView):
-    """Addons list view."""
+class SupervisorGatewayProxyView(HomeAssistantView):
+    """Base view for endpoints that forward a request to the Supervisor."""
 
-    url = "/api/supervisor_gateway/addons"
-    name = "api:supervisor_gateway:addons"
     requires_auth = True
 
     def __init__(self, hass: HomeAssistant):
         """Initialize."""
         self.hass = hass
-
-    async def get(self, request):
-        """Handle GET request - list all addons."""
-        # Validate x-api-key header
-        if not validate_api_key(self.hass, request):
-            return self.json_message("Invalid or missing x-api-key header", 401)
+        self.validate_api_key = hass.data[DOMAIN]["validate_api_key"]
+        self.session = hass.data[DOMAIN]["session"]
+        self.request_semaphore = hass.data[DOMAIN]["request_semaphore"]
+        self.action_semaphore = hass.data[DOMAIN]["action_semaphore"]
+
+    async def _async_proxy(
+        self, method: str, path: str, error_context: str, timeout: aiohttp.ClientTimeout | None = None
+    ) -> web.Response:
+        """Forward a request to the Supervisor and pass its response through."""
+        # Calls with their own timeout are actions and updates, which may run for minutes
+        semaphore = self.request_semaphore if timeout is None else self.action_semaphore
 
         try:
-            # Get supervisor token from environment or hassio data
-            import os
-            supervisor_token = os.environ.get("SUPERVISOR_TOKEN")
+            async with asyncio.timeout(SUPERVISOR_SLOT_WAIT):
+                await semaphore.acquire()
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Too many Supervisor requests in flight, gave up %s", error_context)
+            return self.json_message("Supervisor busy", 503)
 
-            if not supervisor_token:
-                # Try getting from hassio integration
-                if "hassio" in self.hass.data:
-                    supervisor_token = self.hass.data["hassio"].get("supervisor_token")
+        try:
+            headers = self.hass.data[DOMAIN]["auth_headers"]
+            if headers is None:
+                # The token may not have been available yet when the integration was set up
+                headers = self.hass.data[DOMAIN]["auth_headers"] = resolve_supervisor_headers(self.hass)
 
-            if not supervisor_token:
+            if headers is None:
                 _LOGGER.error("Cannot access Supervisor token")
                 return self.json_message("Supervisor token not available", 500)
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{SUPERVISOR_URL}/addons",
-                    headers={"Authorization": f"Bearer {supervisor_token}"},
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    data = await resp.json()
-                    return self.json(data, status_code=resp.status)
+            status, content_type, body = await self._async_request(method, path, headers, timeout)
+
+            if status == 401:
+                # The Supervisor token may have been rotated, re-read it and retry once
+                refreshed = resolve_supervisor_headers(self.hass)
+                if refreshed is not None and refreshed != headers:
+                    self.hass.data[DOMAIN]["auth_headers"] = refreshed
+                    status, content_type, body = await self._async_request(method, path, refreshed, timeout)
+
+            return web.Response(body=body, status=status, content_type=content_type)
+
+        except asyncio.TimeoutError:
+            _LOGGER.warning("Timeout %s", error_context)
+            return self.json_message("Supervisor timeout", 504)
+
+        except aiohttp.ClientError:
+            _LOGGER.exception("Error %s", error_context)
+            return self.json_message("Supervisor unreachable", 502)
+
+        finally:
+            semaphore.release()
+
+    async def _async_request(
+        self, method: str, path: str, headers: dict[str, str], timeout: aiohttp.ClientTimeout | None
+    ) -> tuple[int, str, bytes]:
+        """Send one request to the Supervisor and return its status, content type and body."""
+        async with self.session.request(
+            method,
+            path,
+            headers=headers,
+            timeout=timeout or self.session.timeout
+        ) as resp:
+            return resp.status, resp.content_type, await resp.read()
+
+    async def _async_cached_get(self, path: str, error_context: str) -> web.Response:
+        """GET a Supervisor path through the cache, sharing one request between concurrent callers."""
+        cached = get_cached_response(path)
+        if cached is not None:
+            return cached
+
+        task = _inflight_gets.get(path)
+        if task is None:
+            task = self.hass.async_create_task(self._async_fetch_and_cache(path, error_context))
+            _inflight_gets[path] = task
+            task.add_done_callback(functools.partial(forget_inflight_get, path))
+
+        # Shielded so a caller disconnecting does not cancel the fetch for the others
+        response = await asyncio.shield(task)
+        # A web.Response can only be sent once, so each caller gets its own
+        return web.Response(body=response.body, status=response.status, content_type=response.content_type)
+
+    async def _async_fetch_and_cache(self, path: str, error_context: str) -> web.Response:
+        """GET a Supervisor path and cache it if successful and not invalidated meanwhile."""
+        generation = _cache_generation
+        response = await self._async_proxy("GET", path, error_context)
+        if response.status == 200 and generation == _cache_generation:
+            cache_response(path, response.content_type, response.body)
+        return response
+
+    async def _async_addon_action(self, addon_slug: str, action: str) -> web.Response:
+        """Run an action on an addon and drop its cached responses."""
+        # Use longer timeout for update operations
+        timeout = UPDATE_TIMEOUT if action == "update" else ACTION_TIMEOUT
 
-        except Exception as e:
-            _LOGGER.error(f"Error fetching addons: {e}")
-            return self.json_message(f"Error: {str(e)}", 500)
+        try:
+            return await self._async_proxy(
+                "POST", f"/addons/{addon_slug}/{action}", f"performing {action} on addon {addon_slug}", timeout
+            )
+        finally:
+            # Even a failed action may have reached the Supervisor and changed the addon
+            invalidate_addon_cache(addon_slug)
 
 
-class SupervisorGatewayAddonView(HomeAssistantView):
-    """Single addon view."""
+class SupervisorGatewayAddonsView(SupervisorGatewayProxyView):
+    """Addons list view."""
 
-    url = "/api/supervisor_gateway/addons/{addon_slug}"
-    name = "api:supervisor_gateway:addon"
-    requires_auth = True
+    url = "/api/supervisor_gateway/addons"
+    name = "api:supervisor_gateway:addons"
 
-    def __init__(self, hass: HomeAssistant):
-        """Initialize."""
-        self.hass = hass
+    @require_api_key
+    async def get(self, request):
+        """Handle GET request - list all addons, with their info if hydrate=1."""
+        response = await self._async_cached_get("/addons", "fetching addons")
+        if request.query.get("hydrate") != "1" or response.status != 200:
+            return response
 
-    async def get(self, request, addon_slug):
-        """Handle GET request - get addon info."""
-        # Validate x-api-key header
-        if not validate_api_key(self.hass, request):
-            return self.json_message("Invalid or missing x-api-key header", 401)
+        try:
+            listing = json_loads(response.body)
+            addons = [addon for addon in listing["data"]["addons"] if isinstance(addon, dict)]
+        except (ValueError, KeyError, TypeError):
+            # Not the listing shape we know how to hydrate, pass it through unchanged
+            return response
+
+        semaphore = asyncio.Semaphore(HYDRATE_CONCURRENCY)
+        await asyncio.gather(*(self._async_hydrate(addon, semaphore) for addon in addons))
+        return self.json(listing)
+
+    async def _async_hydrate(self, addon: dict, semaphore: asyncio.Semaphore) -> None:
+        """Attach the addon's info to its entry in the addon list, or the status of the failed fetch."""
+        slug = addon.get("slug")
+        if not isinstance(slug, str) or not ADDON_SLUG_RE.fullmatch(slug):
+            return
+
+        async with semaphore:
+            response = await self._async_cached_get(f"/addons/{slug}/info", f"fetching addon {slug}")
+
+        if response.status != 200:
+            addon["info_status"] = response.status
+            return
 
         try:
-            # Get supervisor token from environment or hassio data
-            import os
-            supervisor_token = os.environ.get("SUPERVISOR_TOKEN")
+            addon["info"] = json_loads(response.body)["data"]
+        except (ValueError, KeyError, TypeError):
+            _LOGGER.warning("Unexpected info response for addon %s", slug)
+            addon["info_status"] = 502
 
-            if not supervisor_token and "hassio" in self.hass.data:
-                supervisor_token = self.hass.data["hassio"].get("supervisor_token")
 
-            if not supervisor_token:
-                return self.json_message("Supervisor token not available", 500)
+class SupervisorGatewayAddonView(SupervisorGatewayProxyView):
+    """Single addon view."""
+
+    url = "/api/supervisor_gateway/addons/{addon_slug}"
+    name = "api:supervisor_gateway:addon"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{SUPERVISOR_URL}/addons/{addon_slug}/info",
-                    headers={"Authorization": f"Bearer {supervisor_token}"},
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    data = await resp.json()
-                    return self.json(data, status_code=resp.status)
+    @require_api_key
+    async def get(self, request, addon_slug):
+        """Handle GET request - get addon info."""
+        if not ADDON_SLUG_RE.fullmatch(addon_slug):
+            return self.json_message(INVALID_SLUG_MESSAGE, 400)
 
-        except Exception as e:
-            _LOGGER.error(f"Error fetching addon {addon_slug}: {e}")
-            return self.json_message(f"Error: {str(e)}", 500)
+        return await self._async_cached_get(f"/addons/{addon_slug}/info", f"fetching addon {addon_slug}")
 
 
-class SupervisorGatewayAddonActionView(HomeAssistantView):
+class SupervisorGatewayAddonActionView(SupervisorGatewayProxyView):
     """Addon actions view."""
 
-    url = "/api/supervisor_gateway/addons/{addon_slug}/{action}"
+    url = "/api/supervisor_gateway/addons/{addon_slug}/{action:" + ADDON_ACTION_PATTERN + "}"
     name = "api:supervisor_gateway:addon:action"
-    requires_auth = True
-
-    def __init__(self, hass: HomeAssistant):
-        """Initialize."""
-        self.hass = hass
 
+    @require_api_key
     async def post(self, request, addon_slug, action):
         """Handle POST request - perform addon action."""
-        # Validate x-api-key header
-        if not validate_api_key(self.hass, request):
-            return self.json_message("Invalid or missing x-api-key header", 401)
+        if not ADDON_SLUG_RE.fullmatch(addon_slug):
+            return self.json_message(INVALID_SLUG_MESSAGE, 400)
 
-        allowed_actions = ["update", "start", "stop", "restart"]
+        # The route only matches known actions, this guards direct calls
+        if action not in ADDON_ACTIONS:
+            return self.json_message(INVALID_ACTION_MESSAGE, 400)
 
-        if action not in allowed_actions:
-            return self.json_message(f"Invalid action. Allowed: {', '.join(allowed_actions)}", 400)
+        return await self._async_addon_action(addon_slug, action)
 
-        try:
-            # Get supervisor token from environment or hassio data
-            import os
-            supervisor_token = os.environ.get("SUPERVISOR_TOKEN")
 
-            if not supervisor_token and "hassio" in self.hass.data:
-                supervisor_token = self.hass.data["hassio"].get("supervisor_token")
+class SupervisorGatewayAddonsBatchView(SupervisorGatewayProxyView):
+    """Batch addon actions view."""
 
-            if not supervisor_token:
-                return self.json_message("Supervisor token not available", 500)
+    url = "/api/supervisor_gateway/addons:batch"
+    name = "api:supervisor_gateway:addons:batch"
 
-            # Use longer timeout for update operations
-            timeout = 300 if action == "update" else 30
+    @require_api_key
+    async def post(self, request):
+        """Handle POST request - perform several addon actions concurrently."""
+        try:
+            body = await request.json()
+        except ValueError:
+            return self.json_message("Invalid JSON body", 400)
+
+        ops = body.get("ops") if isinstance(body, dict) else None
+        if not isinstance(ops, list) or not ops:
+            return self.json_message("Body must contain a non-empty 'ops' list", 400)
+
+        if len(ops) > BATCH_MAX_OPS:
+            return self.json_message(f"Too many ops. Maximum: {BATCH_MAX_OPS}", 400)
+
+        for op in ops:
+            if (
+                not isinstance(op, dict)
+                or not isinstance(op.get("slug"), str)
+                or not ADDON_SLUG_RE.fullmatch(op["slug"])
+                or not isinstance(op.get("action"), str)
+                or op["action"] not in ADDON_ACTIONS
+            ):
+                return self.json_message(f"Each op needs a valid 'slug' and an 'action'. {INVALID_ACTION_MESSAGE}", 400)
+
+        # Ops run concurrently, so two actions on one addon would race at the Supervisor
+        if len({op["slug"] for op in ops}) != len(ops):
+            return self.json_message("Each addon slug may appear only once per batch", 400)
+
+        results = await asyncio.gather(*(self._async_batch_op(op["slug"], op["action"]) for op in ops))
+        return self.json(results)
+
+    async def _async_batch_op(self, addon_slug: str, action: str) -> dict:
+        """Run one batch op and describe its outcome."""
+        try:
+            response = await self._async_addon_action(addon_slug, action)
+        except Exception:
+            # One failing op must not turn the whole batch into a 500
+            _LOGGER.exception("Error performing %s on addon %s", action, addon_slug)
+            return {"slug": addon_slug, "action": action, "status": 500, "data": {"message": "Internal error"}}
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{SUPERVISOR_URL}/addons/{addon_slug}/{action}",
-                    headers={"Authorization": f"Bearer {supervisor_token}"},
-                    timeout=aiohttp.ClientTimeout(total=timeout)
-                ) as resp:
-                    data = await resp.json()
-                    return self.json(data, status_code=resp.status)
+        try:
+            data = json_loads(response.body)
+        except ValueError:
+            # The upstream body is not guaranteed to be UTF-8
+            data = response.body.decode("utf-8", "replace")
 
-        except Exception as e:
-            _LOGGER.error(f"Error performing {action} on addon {addon_slug}: {e}")
-            return self.json_message(f"Error: {str(e)}", 500)
+        return {"slug": addon_slug, "action": action, "status": response.status, "data": data}
 
 
-class SupervisorGatewayOsInfoView(HomeAssistantView):
+class SupervisorGatewayOsInfoView(SupervisorGatewayProxyView):
     """OS info view."""
 
     url = "/api/supervisor_gateway/os/info"
     name = "api:supervisor_gateway:os:info"
-    requires_auth = True
-
-    def __init__(self, hass: HomeAssistant):
-        self.hass = hass
 
+    @require_api_key
     async def get(self, request):
         """Handle GET request - get OS info."""
-        if not validate_api_key(self.hass, request):
-            return self.json_message("Invalid or missing x-api-key header", 401)
-
-        try:
-            import os
-            supervisor_token = os.environ.get("SUPERVISOR_TOKEN")
-            if not supervisor_token and "hassio" in self.hass.data:
-                supervisor_token = self.hass.data["hassio"].get("supervisor_token")
-            if not supervisor_token:
-                return self.json_message("Supervisor token not available", 500)
+        return await self._async_proxy("GET", "/os/info", "fetching OS info")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{SUPERVISOR_URL}/os/info",
-                    headers={"Authorization": f"Bearer {supervisor_token}"},
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    data = await resp.json()
-                    return self.json(data, status_code=resp.status)
 
-        except Exception as e:
-            _LOGGER.error(f"Error fetching OS info: {e}")
-            return self.json_message(f"Error: {str(e)}", 500)
-
-
-class SupervisorGatewayOsUpdateView(HomeAssistantView):
+class SupervisorGatewayOsUpdateView(SupervisorGatewayProxyView):
     """OS update view."""
 
     url = "/api/supervisor_gateway/os/update"
     name = "api:supervisor_gateway:os:update"
-    requires_auth = True
-
-    def __init__(self, hass: HomeAssistant):
-        self.hass = hass
 
+    @require_api_key
     async def post(self, request):
         """Handle POST request - update OS."""
-        if not validate_api_key(self.hass, request):
-            return self.json_message("Invalid or missing x-api-key header", 401)
-
-        try:
-            import os
-            supervisor_token = os.environ.get("SUPERVISOR_TOKEN")
-            if not supervisor_token and "hassio" in self.hass.data:
-                supervisor_token = self.hass.data["hassio"].get("supervisor_token")
-            if not supervisor_token:
-                return self.json_message("Supervisor token not available", 500)
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{SUPERVISOR_URL}/os/update",
-                    headers={"Authorization": f"Bearer {supervisor_token}"},
-                    timeout=aiohttp.ClientTimeout(total=300)
-                ) as resp:
-                    data = await resp.json()
-                    return self.json(data, status_code=resp.status)
-
-        except Exception as e:
-            _LOGGER.error(f"Error updating OS: {e}")
-            return self.json_message(f"Error: {str(e)}", 500)
+        return await self._async_proxy("POST", "/os/update", "updating OS", UPDATE_TIMEOUT)
 
 
-class SupervisorGatewayCoreInfoView(HomeAssistantView):
+class SupervisorGatewayCoreInfoView(SupervisorGatewayProxyView):
     """Core info view."""
 
     url = "/api/supervisor_gateway/core/info"
     name = "api:supervisor_gateway:core:info"
-    requires_auth = True
-
-    def __init__(self, hass: HomeAssistant):
-        self.hass = hass
 
+    @require_api_key
     async def get(self, request):
         """Handle GET request - get Core info."""
-        if not validate_api_key(self.hass, request):
-            return self.json_message("Invalid or missing x-api-key header", 401)
-
-        try:
-            import os
-            supervisor_token = os.environ.get("SUPERVISOR_TOKEN")
-            if not supervisor_token and "hassio" in self.hass.data:
-                supervisor_token = self.hass.data["hassio"].get("supervisor_token")
-            if not supervisor_token:
-                return self.json_message("Supervisor token not available", 500)
+        return await self._async_proxy("GET", "/core/info", "fetching Core info")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{SUPERVISOR_URL}/core/info",
-                    headers={"Authorization": f"Bearer {supervisor_token}"},
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    data = await resp.json()
-                    return self.json(data, status_code=resp.status)
 
-        except Exception as e:
-            _LOGGER.error(f"Error fetching Core info: {e}")
-            return self.json_message(f"Error: {str(e)}", 500)
-
-
-class SupervisorGatewayCoreUpdateView(HomeAssistantView):
+class SupervisorGatewayCoreUpdateView(SupervisorGatewayProxyView):
     """Core update view."""
 
     url = "/api/supervisor_gateway/core/update"
     name = "api:supervisor_gateway:core:update"
-    requires_auth = True
-
-    def __init__(self, hass: HomeAssistant):
-        self.hass = hass
 
+    @require_api_key
     async def post(self, request):
         """Handle POST request - update Core."""
-        if not validate_api_key(self.hass, request):
-            return self.json_message("Invalid or missing x-api-key header", 401)
-
-        try:
-            import os
-            supervisor_token = os.environ.get("SUPERVISOR_TOKEN")
-            if not supervisor_token and "hassio" in self.hass.data:
-                supervisor_token = self.hass.data["hassio"].get("supervisor_token")
-            if not supervisor_token:
-                return self.json_message("Supervisor token not available", 500)
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{SUPERVISOR_URL}/core/update",
-                    headers={"Authorization": f"Bearer {supervisor_token}"},
-                    timeout=aiohttp.ClientTimeout(total=300)
-                ) as resp:
-                    data = await resp.json()
-                    return self.json(data, status_code=resp.status)
-
-        except Exception as e:
-            _LOGGER.error(f"Error updating Core: {e}")
-            return self.json_message(f"Error: {str(e)}", 500)
+        return await self._async_proxy("POST", "/core/update", "updating Core", UPDATE_TIMEOUT)